@@ -5,23 +5,28 @@ MCP Product Documentation Server - Configuration Generator
 This script generates the MCP configuration that you need to add to your MCP client.
 """
 
+import importlib.metadata
 import json
 import os
+import re
 import subprocess
 import sys
 from pathlib import Path
 
+# Project paths, resolved once at import time
+PROJECT_DIR = Path(__file__).resolve().parent
+SERVER_DIR = PROJECT_DIR / "mcp_server"
+SERVER_SCRIPT = SERVER_DIR / "mcp_prompt_server.py"
+REQUIREMENTS_FILE = SERVER_DIR / "requirements.txt"
+PROMPTS_DIR = SERVER_DIR / "prompts"
+
 
 def generate_mcp_config():
     """Generate MCP configuration for the product documentation server"""
 
-    # Get the absolute path to the server script
-    current_dir = Path(__file__).parent.absolute()
-    server_script = current_dir / "mcp_server" / "mcp_prompt_server.py"
-
     # Check if server script exists
-    if not server_script.exists():
-        print(f"❌ Error: Server script not found at {server_script}")
+    if not SERVER_SCRIPT.exists():
+        print(f"❌ Error: Server script not found at {SERVER_SCRIPT}")
         print("Make sure you're running this from the project root directory.")
         return None
 
@@ -30,23 +35,44 @@ def generate_mcp_config():
         "mcpServers": {
             "mcp-product-documentation": {
                 "command": "python3",
-                "args": [str(server_script)],
+                "args": [str(SERVER_SCRIPT)],
             }
         }
     }
 
-    return config, str(current_dir)
+    return config, str(PROJECT_DIR)
+
+
+def find_missing_requirements(requirements_file):
+    """Return requirement specs from requirements.txt that are not installed"""
+    missing = []
+    for line in requirements_file.read_text().splitlines():
+        spec = line.split("#", 1)[0].strip()
+        if not spec:
+            continue
+        # The distribution name is everything before the version specifier
+        name = re.split(r"[<>=!~\[;\s]", spec, maxsplit=1)[0]
+        try:
+            importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            missing.append(spec)
+    return missing
 
 
 def install_dependencies():
     """Install Python dependencies if not already installed"""
-    requirements_file = Path(__file__).parent / "mcp_server" / "requirements.txt"
-
-    if not requirements_file.exists():
+    if not REQUIREMENTS_FILE.exists():
         print("⚠️  Warning: requirements.txt not found")
         return False
 
-    print("🔧 Installing Python dependencies...")
+    # Probe installed versions in-process so we only spawn pip for
+    # requirements that are actually missing
+    missing = find_missing_requirements(REQUIREMENTS_FILE)
+    if not missing:
+        print("✅ Dependencies already satisfied!")
+        return True
+
+    print(f"🔧 Installing Python dependencies: {', '.join(missing)}")
 
     # Try different installation methods in order of preference
     install_methods = [
@@ -58,8 +84,7 @@ def install_dependencies():
                 "pip",
                 "install",
                 "--user",
-                "-r",
-                str(requirements_file),
+                *missing,
             ],
             "description": "user installation",
         },
@@ -71,8 +96,7 @@ def install_dependencies():
                 "pip",
                 "install",
                 "--break-system-packages",
-                "-r",
-                str(requirements_file),
+                *missing,
             ],
             "description": "system-wide installation",
         },
@@ -81,19 +105,36 @@ def install_dependencies():
     for method in install_methods:
         try:
             print(f"   Trying {method['description']}...")
-            result = subprocess.run(
-                method["args"], capture_output=True, text=True, check=True
+            proc = subprocess.Popen(
+                method["args"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
             )
-            print("✅ Dependencies installed successfully!")
-            return True
 
-        except subprocess.CalledProcessError as e:
-            if "externally-managed-environment" in e.stderr:
+            # Stream stderr so a PEP 668 refusal aborts the attempt
+            # immediately instead of waiting for pip to finish resolving
+            blocked = False
+            for line in proc.stderr:
+                if "externally-managed-environment" in line:
+                    blocked = True
+                    proc.kill()
+                    break
+            proc.wait()
+
+            if blocked:
                 print(f"   ⚠️  {method['description']} blocked by system policy")
                 continue
-            else:
-                print(f"   ❌ {method['description']} failed: {e}")
-                continue
+
+            if proc.returncode == 0:
+                print("✅ Dependencies installed successfully!")
+                return True
+
+            print(
+                f"   ❌ {method['description']} failed with exit code {proc.returncode}"
+            )
+            continue
         except Exception as e:
             print(f"   ❌ Unexpected error with {method['description']}: {e}")
             continue
@@ -129,14 +170,17 @@ def check_dependencies():
 
 def check_prompts():
     """Check available prompt templates"""
-    prompts_dir = Path(__file__).parent / "mcp_server" / "prompts"
-
-    if not prompts_dir.exists():
+    try:
+        with os.scandir(PROMPTS_DIR) as entries:
+            return sorted(
+                entry.name[:-4]
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+                and entry.name.endswith(".txt")
+            )
+    except OSError:
         return []
 
-    prompt_files = list(prompts_dir.glob("*.txt"))
-    return [f.stem for f in prompt_files]
-
 
 def main():
     """Main function"""
@@ -166,7 +210,7 @@ def main():
     print(f"📁 Project location: {project_path}")
     print(f"📝 Available prompts: {len(prompts)}")
     if prompts:
-        for prompt in sorted(prompts):
+        for prompt in prompts:
             print(f"   • {prompt}")
 
     print("\n" + "=" * 50)
@@ -174,7 +218,8 @@ def main():
     print("=" * 50)
     print("\nCopy this configuration to your MCP client:")
     print("\n🔸 For Cursor IDE (~/.cursor/mcp.json):")
-    print(json.dumps(config, indent=2))
+    json.dump(config, sys.stdout, indent=2)
+    sys.stdout.write("\n")
 
     print("\n" + "=" * 50)
     print("✅ Setup Complete!")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+MCP Product Documentation Server - REST API
+
+A small FastAPI application that exposes the prompt templates over HTTP.
+This complements the MCP stdio server and is what the test suite runs
+against.
+"""
+
+from pathlib import Path
+
+from fastapi import Depends, FastAPI, HTTPException
+
+from prompt_utils import PROMPTS_DIR, is_safe_task_name
+
+app = FastAPI(title="mcp-product-documentation")
+
+
+def get_prompts_dir() -> Path:
+    """
+    Returns the prompts directory. Declared as a dependency so tests can
+    swap it out via app.dependency_overrides.
+    """
+    return PROMPTS_DIR
+
+
+# The :path convertor keeps traversal attempts containing '/' routed to
+# this handler so they are rejected with 400 instead of missing the route
+@app.get("/api/v1/prompts/{task_name:path}")
+def get_prompt(task_name: str, prompts_dir: Path = Depends(get_prompts_dir)):
+    """
+    Returns the text of a single prompt template.
+    """
+    if not is_safe_task_name(task_name):
+        raise HTTPException(
+            status_code=400, detail="Task name contains invalid characters"
+        )
+
+    prompt_file = prompts_dir / f"{task_name}.txt"
+    if not prompt_file.is_file():
+        raise HTTPException(
+            status_code=404, detail=f"Prompt not found for task: {task_name}"
+        )
+
+    return {"prompt_text": prompt_file.read_text(encoding="utf-8")}
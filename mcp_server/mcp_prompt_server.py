@@ -8,9 +8,10 @@ This server implements the MCP specification to serve prompts as tools.
 
 import asyncio
 import json
-import re
-from pathlib import Path
-from typing import Any, Dict, List
+import os
+import stat
+import sys
+from typing import Any, Dict, List, Tuple
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -23,68 +24,146 @@ from mcp.types import (
     Tool,
 )
 
-# Configuration
-PROMPTS_DIR = Path(__file__).parent / "prompts"
+from prompt_utils import PROMPTS_DIR, is_safe_task_name
 
 # Create the MCP server
 app = Server("mcp-product-documentation")
 
 
-def is_safe_task_name(task_name: str) -> bool:
+# Cached prompt listing, invalidated when the directory mtime changes
+_PROMPTS_CACHE: Dict[str, Any] = {
+    "mtime": -1,
+    "names": (),
+    "tool_info": (),
+    "valid": frozenset(),
+}
+
+
+def get_available_prompts() -> Tuple[str, ...]:
     """
-    Validates the task name to prevent directory traversal and ensure it's a simple string.
-    Allows alphanumeric characters and underscores.
+    Returns the available prompt task names by scanning the prompts directory.
+    The result is cached and only rescanned when the directory is modified.
     """
-    if not task_name:
-        return False
-    if re.fullmatch(r"[a-zA-Z0-9_]+", task_name) and ".." not in task_name:
-        return True
-    return False
+    try:
+        st_mtime_ns = os.stat(PROMPTS_DIR).st_mtime_ns
+    except OSError:
+        return ()
+
+    if st_mtime_ns == _PROMPTS_CACHE["mtime"]:
+        return _PROMPTS_CACHE["names"]
+
+    prompt_files = []
+    try:
+        with os.scandir(PROMPTS_DIR) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if not entry.name.endswith(".txt"):
+                    continue
+                # Remove the .txt extension to get the task name;
+                # intern so later lookups hash the same string object
+                task_name = sys.intern(entry.name[:-4])
+                if is_safe_task_name(task_name):
+                    prompt_files.append(task_name)
+    except OSError:
+        return ()
+
+    # Plain ASCII names, so the default key-less sort is the fast path
+    prompt_files.sort()
+    names = tuple(prompt_files)
+    _PROMPTS_CACHE["mtime"] = st_mtime_ns
+    _PROMPTS_CACHE["names"] = names
+    _PROMPTS_CACHE["tool_info"] = tuple(
+        (
+            f"get_prompt_{name}",
+            f"Fetches the '{name}' prompt template. This provides a structured template for {name.replace('_', ' ')} tasks.",
+        )
+        for name in names
+    )
+    _PROMPTS_CACHE["valid"] = frozenset(names)
+    return names
 
 
-def get_available_prompts() -> List[str]:
+def _get_valid_prompts() -> frozenset:
     """
-    Returns a list of available prompt task names by scanning the prompts directory.
+    Returns the set of known prompt names for O(1) membership checks.
     """
-    if not PROMPTS_DIR.exists() or not PROMPTS_DIR.is_dir():
-        return []
+    if not get_available_prompts():
+        return frozenset()
+    return _PROMPTS_CACHE["valid"]
+
+
+def _get_prompt_tool_info() -> Tuple[Tuple[str, str], ...]:
+    """
+    Returns the precomputed (tool name, description) pair for each prompt.
+    """
+    if not get_available_prompts():
+        return ()
+    return _PROMPTS_CACHE["tool_info"]
 
-    prompt_files = []
-    for file_path in PROMPTS_DIR.glob("*.txt"):
-        # Remove the .txt extension to get the task name
-        task_name = file_path.stem
-        if is_safe_task_name(task_name):
-            prompt_files.append(task_name)
 
-    return sorted(prompt_files)
+# Cached prompt contents keyed by task name, invalidated per-file by mtime
+_PROMPT_CACHE: Dict[str, Tuple[int, str]] = {}
 
 
 def read_prompt_content(task_name: str) -> str:
     """
     Reads the content of a specific prompt file.
+    Contents are cached and only re-read when the file is modified.
     """
-    if not is_safe_task_name(task_name):
+    # Known prompt names short-circuit the regex validation
+    if task_name not in _get_valid_prompts() and not is_safe_task_name(task_name):
         raise ValueError(f"Invalid task name: {task_name}")
 
     prompt_file_path = PROMPTS_DIR / f"{task_name}.txt"
 
-    if not prompt_file_path.exists() or not prompt_file_path.is_file():
+    try:
+        st = os.stat(prompt_file_path)
+    except OSError:
+        raise FileNotFoundError(f"Prompt not found for task: {task_name}") from None
+    if not stat.S_ISREG(st.st_mode):
         raise FileNotFoundError(f"Prompt not found for task: {task_name}")
 
+    st_mtime_ns = st.st_mtime_ns
+    cached = _PROMPT_CACHE.get(task_name)
+    if cached is not None and cached[0] == st_mtime_ns:
+        return cached[1]
+
     try:
-        with open(prompt_file_path, "r", encoding="utf-8") as f:
-            return f.read()
+        fd = os.open(prompt_file_path, os.O_RDONLY)
+        try:
+            if hasattr(os, "posix_fadvise"):
+                # Hint the kernel to prefetch the whole file in one go
+                os.posix_fadvise(fd, 0, st.st_size, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(fd, 0, st.st_size, os.POSIX_FADV_WILLNEED)
+            content = os.read(fd, st.st_size).decode("utf-8")
+        finally:
+            os.close(fd)
     except IOError as e:
         raise IOError(f"Error reading prompt file for task: {task_name}") from e
 
+    _PROMPT_CACHE[task_name] = (st_mtime_ns, content)
+    return content
+
+
+# Cached Tool list, rebuilt only when the prompts directory changes
+_TOOLS_CACHE: Dict[str, Any] = {"mtime": -1, "tools": None}
+
 
 @app.list_tools()
 async def list_tools() -> List[Tool]:
     """
     List all available prompt tools.
     Each prompt file becomes a tool that can be called.
+    The list is cached and only rebuilt when the prompts directory changes.
     """
-    available_prompts = get_available_prompts()
+    try:
+        st_mtime_ns = os.stat(PROMPTS_DIR).st_mtime_ns
+    except OSError:
+        st_mtime_ns = -1
+
+    if _TOOLS_CACHE["tools"] is not None and st_mtime_ns == _TOOLS_CACHE["mtime"]:
+        return _TOOLS_CACHE["tools"]
 
     tools = []
 
@@ -98,11 +177,11 @@ async def list_tools() -> List[Tool]:
     )
 
     # Add a tool for each prompt
-    for prompt_name in available_prompts:
+    for tool_name, description in _get_prompt_tool_info():
         tools.append(
             Tool(
-                name=f"get_prompt_{prompt_name}",
-                description=f"Fetches the '{prompt_name}' prompt template. This provides a structured template for {prompt_name.replace('_', ' ')} tasks.",
+                name=tool_name,
+                description=description,
                 inputSchema={"type": "object", "properties": {}, "required": []},
             )
         )
@@ -125,16 +204,64 @@ async def list_tools() -> List[Tool]:
         )
     )
 
+    _TOOLS_CACHE["mtime"] = st_mtime_ns
+    _TOOLS_CACHE["tools"] = tools
     return tools
 
 
+# Tool-name dispatch table, rebuilt when the prompt listing changes
+_DISPATCH_CACHE: Dict[str, Any] = {"names": None, "dispatch": {}}
+
+
+def _get_call_dispatch() -> Dict[str, Tuple[str, Any]]:
+    """
+    Returns a mapping of tool name to a (tag, task_name) pair for O(1)
+    dispatch in call_tool. Rebuilt only when the prompt listing changes.
+    """
+    available_prompts = get_available_prompts()
+    if available_prompts is not _DISPATCH_CACHE["names"]:
+        dispatch: Dict[str, Tuple[str, Any]] = {
+            "list_available_prompts": ("list", None),
+            "get_prompt_by_name": ("by_name", None),
+        }
+        for prompt_name in available_prompts:
+            dispatch[f"get_prompt_{prompt_name}"] = ("direct", prompt_name)
+        _DISPATCH_CACHE["names"] = available_prompts
+        _DISPATCH_CACHE["dispatch"] = dispatch
+    return _DISPATCH_CACHE["dispatch"]
+
+
+async def _fetch_prompt(task_name: str) -> List[TextContent]:
+    """
+    Reads a prompt and wraps it (or the resulting error) as tool output.
+    The blocking file read runs in a worker thread so concurrent tool
+    calls do not stall the event loop.
+    """
+    try:
+        prompt_content = await asyncio.to_thread(read_prompt_content, task_name)
+        return [
+            TextContent(
+                type="text",
+                text=f"Prompt for '{task_name}':\n\n{prompt_content}",
+            )
+        ]
+    except (ValueError, FileNotFoundError, IOError) as e:
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """
     Handle tool calls for prompt fetching.
     """
     try:
-        if name == "list_available_prompts":
+        entry = _get_call_dispatch().get(name)
+        if entry is None:
+            return [TextContent(type="text", text=f"Error: Unknown tool '{name}'")]
+
+        tag, task_name = entry
+
+        if tag == "list":
             available_prompts = get_available_prompts()
             prompt_list = "\n".join([f"- {prompt}" for prompt in available_prompts])
             return [
@@ -144,7 +271,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
                 )
             ]
 
-        elif name == "get_prompt_by_name":
+        if tag == "by_name":
             task_name = arguments.get("task_name")
             if not task_name:
                 return [
@@ -153,34 +280,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
                     )
                 ]
 
-            try:
-                prompt_content = read_prompt_content(task_name)
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Prompt for '{task_name}':\n\n{prompt_content}",
-                    )
-                ]
-            except (ValueError, FileNotFoundError, IOError) as e:
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        elif name.startswith("get_prompt_"):
-            # Extract task name from tool name (e.g., "get_prompt_create_prd" -> "create_prd")
-            task_name = name[len("get_prompt_") :]
-
-            try:
-                prompt_content = read_prompt_content(task_name)
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Prompt for '{task_name}':\n\n{prompt_content}",
-                    )
-                ]
-            except (ValueError, FileNotFoundError, IOError) as e:
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        else:
-            return [TextContent(type="text", text=f"Error: Unknown tool '{name}'")]
+        return await _fetch_prompt(task_name)
 
     except Exception as e:
         return [TextContent(type="text", text=f"Unexpected error: {str(e)}")]
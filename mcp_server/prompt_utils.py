@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Shared prompt configuration and validation.
+
+Used by both the MCP stdio server and the REST API so that neither has
+to import the other.
+"""
+
+import re
+from pathlib import Path
+
+# Configuration
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+# Allowed task-name charset; forbids path separators and dots by construction
+_SAFE_NAME_MATCH = re.compile(r"[A-Za-z0-9_]+").fullmatch
+
+
+def is_safe_task_name(task_name: str) -> bool:
+    """
+    Validates the task name to prevent directory traversal and ensure it's a simple string.
+    Allows alphanumeric characters and underscores.
+    """
+    return bool(task_name) and _SAFE_NAME_MATCH(task_name) is not None